@@ -1,22 +1,53 @@
 import argparse
+import hashlib
+import http.client
 import json
 import logging
 import os
 import shutil
-import tempfile
+import stat
+import threading
 import time
-import urllib.request
-import urllib.error
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional speedup - stdlib json works everywhere
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.json")
-MODS_LIST_CACHE = os.path.join(SCRIPT_DIR, "mods_list.json")
+MODS_LIST_CACHE = os.path.join(SCRIPT_DIR, "mods_list.jsonl")
+MODS_LIST_ETAG = os.path.join(SCRIPT_DIR, "mods_list.etag")
+MODS_LIST_LASTMOD = os.path.join(SCRIPT_DIR, "mods_list.lastmod")
 SYSTEM_MODS = {"base", "space-age", "quality", "elevated-rails"}
+MAX_CONCURRENT_DOWNLOADS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+HTTP_TIMEOUT = 300
+USER_AGENT = "factorio-mods-updater/1.0"
 
 log = logging.getLogger(__name__)
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def json_dumps(data, indent=False):
+    """Serialize to a JSON string, via orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent="\t" if indent else None, ensure_ascii=False)
+
+
 DEFAULT_CONFIG = {
     "mods_api_url": "https://mods.factorio.com/api/mods?page_size=max&full=True&version={version}&is_space_age=true",
     "mod_packs_path": "./mod-packs.json",
@@ -29,16 +60,16 @@ DEFAULT_CONFIG = {
 
 
 def load_config():
-    if not os.path.exists(CONFIG_PATH):
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            config = json_loads(f.read())
+    except FileNotFoundError:
         log.warning("config.json not found - creating default: %s", CONFIG_PATH)
         with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(DEFAULT_CONFIG, f, indent="\t", ensure_ascii=False)
+            f.write(json_dumps(DEFAULT_CONFIG, indent=True))
         log.error("Fill in config.json and run again.")
         raise SystemExit(1)
 
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        config = json.load(f)
-
     missing = [k for k, v in config.items() if isinstance(v, str) and v.startswith("<FILL IN")]
     if missing:
         log.error("Incomplete fields in config.json: %s", ", ".join(missing))
@@ -47,40 +78,62 @@ def load_config():
     return config
 
 
+def _stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
 def validate_paths(config):
+    """Validate configured paths and return (packs, full_version).
+
+    The mod packs file and the version file have to be parsed for
+    validation anyway, so the parsed data is returned instead of being
+    re-read and re-parsed by the caller.
+    """
     errors = []
+    packs = None
+    full_version = None
 
     mod_packs_path = config["mod_packs_path"]
     if not os.path.isabs(mod_packs_path):
         mod_packs_path = os.path.join(SCRIPT_DIR, mod_packs_path)
-    if not os.path.isfile(mod_packs_path):
+    st = _stat_or_none(mod_packs_path)
+    if st is None or not stat.S_ISREG(st.st_mode):
         errors.append(f"mod_packs_path: file does not exist: {mod_packs_path}")
     else:
         try:
-            with open(mod_packs_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(mod_packs_path, "rb") as f:
+                data = json_loads(f.read())
             if not isinstance(data, list):
                 errors.append(f"mod_packs_path: expected JSON array, got {type(data).__name__}")
-        except json.JSONDecodeError as e:
+            else:
+                packs = data
+        except ValueError as e:
             errors.append(f"mod_packs_path: invalid JSON: {e}")
 
     mods_dir = config["mods_dir"]
-    if not os.path.isdir(mods_dir):
+    st = _stat_or_none(mods_dir)
+    if st is None or not stat.S_ISDIR(st.st_mode):
         errors.append(f"mods_dir: directory does not exist: {mods_dir}")
 
     version_file = config["factorio_version_file"]
-    if not os.path.isfile(version_file):
+    st = _stat_or_none(version_file)
+    if st is None or not stat.S_ISREG(st.st_mode):
         errors.append(f"factorio_version_file: file does not exist: {version_file}")
     else:
         try:
-            with open(version_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(version_file, "rb") as f:
+                data = json_loads(f.read())
             version = data.get("version")
             if not version or not isinstance(version, str):
                 errors.append("factorio_version_file: missing 'version' field or invalid type")
             elif len(version.split(".")) < 2:
                 errors.append(f"factorio_version_file: invalid version format: {version}")
-        except json.JSONDecodeError as e:
+            else:
+                full_version = version
+        except ValueError as e:
             errors.append(f"factorio_version_file: invalid JSON: {e}")
 
     if errors:
@@ -88,111 +141,216 @@ def validate_paths(config):
             log.error(err)
         raise SystemExit(1)
 
+    return packs, full_version
 
-def get_factorio_version(version_file_path):
-    with open(version_file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    full_version = data["version"]
-    parts = full_version.split(".")
-    return f"{parts[0]}.{parts[1]}"
 
+def _read_sidecar(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
 
-def fetch_mods_list(api_url, version):
-    url = api_url.format(version=version)
-    log.info("Fetching mod list from API: %s", url)
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=120) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
-    with open(MODS_LIST_CACHE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False)
-    log.info("Saved mod list cache (%d mods)", len(data.get("results", [])))
-    return data
-
-
-def build_mods_index(api_data):
-    index = {}
-    for mod in api_data.get("results", []):
-        name = mod.get("name")
-        latest = mod.get("latest_release")
-        if name and latest:
-            index[name] = latest
-    return index
 
+def _write_sidecar(path, value):
+    if value:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(value)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def load_cached_index():
+    with open(MODS_LIST_CACHE, "r", encoding="utf-8") as f:
+        records = (json_loads(line) for line in f if line.strip())
+        return {mod["name"]: mod["latest_release"] for mod in records}
+
+
+def fetch_and_index(url, max_cache_age=None):
+    """Fetch the mods API payload and reduce it to {name: latest_release} in one pass.
+
+    Only the name and latest_release of each mod are kept - the rest of the
+    multi-MB payload is dropped immediately instead of being held as a full
+    object tree. The cache is written as JSON Lines (one slim record per
+    line) so it can be re-read line by line without loading it whole.
 
-def load_mod_packs(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    The ETag/Last-Modified of the last 200 response are stored next to the
+    cache and sent back as If-None-Match/If-Modified-Since, so an unchanged
+    mod list comes back as a bodyless 304 and the cache is reused. With
+    max_cache_age (minutes), a young enough cache skips the request entirely.
+    """
+    have_cache = os.path.isfile(MODS_LIST_CACHE)
+
+    if max_cache_age is not None and have_cache:
+        age = time.time() - os.path.getmtime(MODS_LIST_CACHE)
+        if age < max_cache_age * 60:
+            log.info("Mod list cache is %.0f min old (< %d min) - skipping API request", age / 60, max_cache_age)
+            return load_cached_index()
+
+    log.info("Fetching mod list from API: %s", url)
+
+    headers = {}
+    if have_cache:
+        etag = _read_sidecar(MODS_LIST_ETAG)
+        lastmod = _read_sidecar(MODS_LIST_LASTMOD)
+        if etag:
+            headers["If-None-Match"] = etag
+        if lastmod:
+            headers["If-Modified-Since"] = lastmod
+
+    resp = _http_get(url, headers=headers)
+    if resp.status == 304:
+        resp.read()
+        log.info("Mod list unchanged (304) - using cache")
+        return load_cached_index()
+    if resp.status != 200:
+        resp.read()
+        raise RuntimeError(f"HTTP {resp.status} from mods API")
+    data = json_loads(resp.read())
+
+    index = {
+        mod["name"]: mod["latest_release"]
+        for mod in data.get("results", [])
+        if mod.get("name") and mod.get("latest_release")
+    }
+    # Same tmp+rename pattern as save_mod_packs: the 304 and
+    # --max-cache-age paths must never see a half-written cache
+    tmp = f"{MODS_LIST_CACHE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for name, latest in index.items():
+            f.write(json_dumps({"name": name, "latest_release": latest}))
+            f.write("\n")
+    os.replace(tmp, MODS_LIST_CACHE)
+    _write_sidecar(MODS_LIST_ETAG, resp.getheader("ETag"))
+    _write_sidecar(MODS_LIST_LASTMOD, resp.getheader("Last-Modified"))
+    log.info("Saved mod list cache (%d mods)", len(index))
+    return index
 
 
 def save_mod_packs(path, packs):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(packs, f, indent="\t", ensure_ascii=False)
+    # Write to a sidecar and rename into place: the old inode (which the
+    # archive hardlink still points at) is never truncated, and a crash
+    # mid-write can't corrupt the live file.
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(json_dumps(packs, indent=True))
+    os.replace(tmp, path)
 
 
-def archive_mod_packs(path):
-    timestamp = int(time.time())
+def archive_mod_packs(path, timestamp):
     archive_path = f"{path}.{timestamp}"
-    shutil.copy2(path, archive_path)
+    try:
+        # O(1) directory entry instead of copying the file's bytes
+        os.link(path, archive_path)
+    except OSError:
+        shutil.copy2(path, archive_path)
     log.info("Archived mod-packs.json -> %s", archive_path)
 
 
-class _NoRedirect(urllib.request.HTTPRedirectHandler):
-    def redirect_request(self, req, fp, code, msg, headers, newurl):
-        return None
+# Per-thread cache of keep-alive connections, keyed by host. Reusing a
+# connection saves one TCP+TLS handshake per request against the same host
+# (mods.factorio.com for redirects, the CDN for the actual files).
+_connections = threading.local()
+
 
+def _get_connection(host):
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get(host)
+    if conn is None:
+        conn = pool[host] = http.client.HTTPSConnection(host, timeout=HTTP_TIMEOUT)
+    return conn
 
-_no_redirect_opener = urllib.request.build_opener(_NoRedirect)
 
+def _http_get(url, headers=None):
+    """GET over a cached keep-alive connection, without following redirects."""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    req_headers = {"User-Agent": USER_AGENT}
+    if headers:
+        req_headers.update(headers)
+
+    conn = _get_connection(parts.netloc)
+    try:
+        conn.request("GET", path, headers=req_headers)
+        return conn.getresponse()
+    except (http.client.HTTPException, OSError):
+        # Stale keep-alive connection (server closed it) - reopen and retry once
+        conn.close()
+        conn.request("GET", path, headers=req_headers)
+        return conn.getresponse()
 
-def download_mod(download_url, file_name, tmp_dir, username, token):
+
+def download_mod(download_url, file_name, dest_dir, username, token, expected_sha1=""):
     url = f"https://mods.factorio.com{download_url}?username={username}&token={token}"
-    dest = os.path.join(tmp_dir, file_name)
+    dest = os.path.join(dest_dir, file_name)
     log.info("[download] Starting: %s", file_name)
-    log.debug("[download] URL: %s", url.replace(token, "***"))
+    log.debug("[download] URL: https://mods.factorio.com%s?username=%s&token=***", download_url, username)
 
     # First request - get redirect URL from mods.factorio.com (no auto-redirect)
-    req = urllib.request.Request(url)
-    req.add_header("User-Agent", "factorio-mods-updater/1.0")
-    try:
-        resp = _no_redirect_opener.open(req, timeout=300)
-        # No redirect - unexpected
+    resp = _http_get(url)
+    log.debug("[download] HTTP %d from mods.factorio.com", resp.status)
+    if resp.status in (301, 302, 303, 307, 308):
+        real_url = resp.getheader("Location")
+        body = resp.read(1024)
+        if not real_url:
+            log.error("[download] Redirect %d without Location header. Headers: %s",
+                      resp.status, dict(resp.getheaders()))
+            log.error("[download] Body: %s", body.decode("utf-8", errors="replace")[:500])
+            raise RuntimeError(f"Redirect {resp.status} without Location")
+        log.info("[download] Redirect %d -> %s", resp.status, real_url)
+    elif resp.status == 200:
         body = resp.read(1024).decode("utf-8", errors="replace")
         resp.close()
         log.error("[download] Expected redirect, got %d for %s", resp.status, file_name)
         log.error("[download] Response body: %s", body[:500])
         raise RuntimeError(f"Expected redirect, got {resp.status}")
-    except urllib.error.HTTPError as e:
-        log.debug("[download] HTTP %d from mods.factorio.com", e.status)
-        if e.status in (301, 302, 303, 307, 308):
-            real_url = e.headers.get("Location")
-            if not real_url:
-                body = e.read(1024).decode("utf-8", errors="replace")
-                log.error("[download] Redirect %d without Location header. Headers: %s", e.status, dict(e.headers))
-                log.error("[download] Body: %s", body[:500])
-                raise RuntimeError(f"Redirect {e.status} without Location")
-            log.info("[download] Redirect %d -> %s", e.status, real_url)
-        else:
-            body = e.read(2048).decode("utf-8", errors="replace")
-            log.error("[download] HTTP error %d from mods.factorio.com for %s", e.status, file_name)
-            log.error("[download] Headers: %s", dict(e.headers))
-            log.error("[download] Body: %s", body[:500])
-            raise
+    else:
+        body = resp.read(2048).decode("utf-8", errors="replace")
+        log.error("[download] HTTP error %d from mods.factorio.com for %s", resp.status, file_name)
+        log.error("[download] Headers: %s", dict(resp.getheaders()))
+        log.error("[download] Body: %s", body[:500])
+        raise RuntimeError(f"HTTP {resp.status} from mods.factorio.com")
 
     # Second request - download file from CDN (dl-mod.factorio.com), clean request without auth
-    cdn_req = urllib.request.Request(real_url)
-    cdn_req.add_header("User-Agent", "factorio-mods-updater/1.0")
-    try:
-        with urllib.request.urlopen(cdn_req, timeout=300) as resp:
-            log.debug("[download] CDN responded %d, Content-Length: %s",
-                      resp.status, resp.headers.get("Content-Length", "?"))
-            with open(dest, "wb") as f:
-                shutil.copyfileobj(resp, f)
-    except urllib.error.HTTPError as e:
-        body = e.read(2048).decode("utf-8", errors="replace")
-        log.error("[download] HTTP error %d from CDN for %s", e.status, file_name)
+    resp = _http_get(real_url)
+    if resp.status != 200:
+        body = resp.read(2048).decode("utf-8", errors="replace")
+        log.error("[download] HTTP error %d from CDN for %s", resp.status, file_name)
         log.error("[download] CDN URL: %s", real_url)
-        log.error("[download] Headers: %s", dict(e.headers))
+        log.error("[download] Headers: %s", dict(resp.getheaders()))
         log.error("[download] Body: %s", body[:500])
+        raise RuntimeError(f"HTTP {resp.status} from CDN")
+
+    log.debug("[download] CDN responded %d, Content-Length: %s",
+              resp.status, resp.getheader("Content-Length", "?"))
+    # Stream to <name>.partial and rename into place on success, so an
+    # interrupted or corrupt download never leaves a bad zip under the
+    # final name. SHA1 is computed on the chunks as they arrive - the
+    # hashing overlaps with the blocking network reads, so no second
+    # pass over the file is needed.
+    partial = f"{dest}.partial"
+    sha1 = hashlib.sha1()
+    try:
+        # 1 MiB chunks cut read/write syscalls 16x vs the 64 KiB default;
+        # buffering=0 skips a second copy through Python's own file buffer.
+        with open(partial, "wb", buffering=0) as f:
+            while chunk := resp.read(DOWNLOAD_CHUNK_SIZE):
+                sha1.update(chunk)
+                f.write(chunk)
+        if expected_sha1 and sha1.hexdigest() != expected_sha1:
+            log.error("[download] SHA1 mismatch for %s: expected %s, got %s",
+                      file_name, expected_sha1, sha1.hexdigest())
+            raise RuntimeError(f"SHA1 mismatch for {file_name}")
+        os.replace(partial, dest)
+    except (OSError, RuntimeError):
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
         raise
 
     size = os.path.getsize(dest)
@@ -200,53 +358,71 @@ def download_mod(download_url, file_name, tmp_dir, username, token):
     return dest
 
 
+def file_sha1(path):
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
 def find_updates(packs, mods_index, factorio_version):
     """Return dict mod_name -> update info for mods that need updating in any pack."""
+    # Narrow to packs on the target Factorio version first, so packs for
+    # other versions cost one prefix comparison instead of a scan of all
+    # their mods - and a config with no matching pack exits immediately.
+    target_packs = [
+        pack for pack in packs
+        if ".".join(pack.get("factorio_version", "").split(".")[:2]) == factorio_version
+    ]
+    if not target_packs:
+        return {}
+
+    # Then flatten to the enabled, non-system mods of the matching packs
+    system_mods = SYSTEM_MODS
+    candidates = [
+        (pack.get("name"), mod)
+        for pack in target_packs
+        for mod in pack.get("mods", ())
+        if mod.get("enabled", False) and mod.get("name", "") not in system_mods
+    ]
+
     updates = {}
-    for pack in packs:
-        pack_fv = pack.get("factorio_version", "")
-        pack_fv_major_minor = ".".join(pack_fv.split(".")[:2])
-        if pack_fv_major_minor != factorio_version:
+    mods_index_get = mods_index.get
+    for pack_name, mod in candidates:
+        mod_get = mod.get
+        mod_name = mod_get("name", "")
+        latest = mods_index_get(mod_name)
+        if not latest:
+            log.warning("Mod '%s' not found in API (pack: %s)", mod_name, pack_name)
             continue
 
-        for mod in pack.get("mods", []):
-            mod_name = mod.get("name", "")
-            if mod_name in SYSTEM_MODS:
-                continue
-            if not mod.get("enabled", False):
-                continue
-
-            latest = mods_index.get(mod_name)
-            if not latest:
-                log.warning("Mod '%s' not found in API (pack: %s)", mod_name, pack.get("name"))
-                continue
-
-            local_version = mod.get("version", "")
-            local_sha1 = mod.get("sha1", "")
-            remote_version = latest.get("version", "")
-            remote_sha1 = latest.get("sha1", "")
-
-            if local_version != remote_version or local_sha1 != remote_sha1:
-                if mod_name not in updates:
-                    updates[mod_name] = {
-                        "mod_name": mod_name,
-                        "new_version": remote_version,
-                        "new_sha1": remote_sha1,
-                        "download_url": latest.get("download_url", ""),
-                        "file_name": latest.get("file_name", ""),
-                        "packs": [],
-                    }
-                updates[mod_name]["packs"].append({
-                    "pack_name": pack.get("name"),
-                    "old_version": local_version,
-                })
+        latest_get = latest.get
+        local_version = mod_get("version", "")
+        local_sha1 = mod_get("sha1", "")
+        remote_version = latest_get("version", "")
+        remote_sha1 = latest_get("sha1", "")
+
+        if local_version != remote_version or local_sha1 != remote_sha1:
+            if mod_name not in updates:
+                updates[mod_name] = {
+                    "mod_name": mod_name,
+                    "new_version": remote_version,
+                    "new_sha1": remote_sha1,
+                    "download_url": latest_get("download_url", ""),
+                    "file_name": latest_get("file_name", ""),
+                    "packs": [],
+                }
+            updates[mod_name]["packs"].append({
+                "pack_name": pack_name,
+                "old_version": local_version,
+            })
 
     return updates
 
 
-def apply_updates(packs, successful_mods, factorio_version):
+def apply_updates(packs, successful_mods, factorio_version, now_ms):
     """Update all mod entries across all matching packs."""
-    now_ms = int(time.time() * 1000)
     updated_packs = 0
 
     for pack in packs:
@@ -256,17 +432,19 @@ def apply_updates(packs, successful_mods, factorio_version):
             continue
 
         pack_changed = False
+        pack_name = pack.get("name")
+        successful_get = successful_mods.get
         for mod in pack.get("mods", []):
             mod_name = mod.get("name", "")
-            if mod_name in successful_mods:
-                info = successful_mods[mod_name]
+            info = successful_get(mod_name)
+            if info is not None:
                 old_ver = mod.get("version", "")
                 new_ver = info["new_version"]
                 if old_ver != new_ver or mod.get("sha1", "") != info["new_sha1"]:
                     mod["version"] = new_ver
                     mod["sha1"] = info["new_sha1"]
                     pack_changed = True
-                    log.info("  [%s] %s: %s -> %s", pack.get("name"), mod_name, old_ver, new_ver)
+                    log.info("  [%s] %s: %s -> %s", pack_name, mod_name, old_ver, new_ver)
 
         if pack_changed:
             pack["updated_at_ms"] = now_ms
@@ -275,9 +453,9 @@ def apply_updates(packs, successful_mods, factorio_version):
     return updated_packs
 
 
-def main():
+def main(max_cache_age=None):
     config = load_config()
-    validate_paths(config)
+    packs, full_version = validate_paths(config)
 
     mod_packs_path = config["mod_packs_path"]
     if not os.path.isabs(mod_packs_path):
@@ -287,14 +465,15 @@ def main():
     username = config["username"]
     token = config["token"]
 
-    factorio_version = get_factorio_version(config["factorio_version_file"])
+    factorio_version = ".".join(full_version.split(".")[:2])
     log.info("Factorio version: %s", factorio_version)
 
-    api_data = fetch_mods_list(config["mods_api_url"], factorio_version)
-    mods_index = build_mods_index(api_data)
+    # Resolve the URL template once - plain substring replace, no
+    # str.format state machine on any later retry/refetch path
+    api_url = config["mods_api_url"].replace("{version}", factorio_version)
+    mods_index = fetch_and_index(api_url, max_cache_age)
     log.info("Indexed %d mods from API", len(mods_index))
 
-    packs = load_mod_packs(mod_packs_path)
     updates = find_updates(packs, mods_index, factorio_version)
 
     if not updates:
@@ -306,40 +485,62 @@ def main():
         for p in info["packs"]:
             log.info("  %s: %s -> %s (pack: %s)", mod_name, p["old_version"], info["new_version"], p["pack_name"])
 
-    # Download to temporary folder
-    tmp_dir = tempfile.mkdtemp(prefix="factorio-mods-")
-    log.info("Temporary folder: %s", tmp_dir)
+    # Dedupe by file_name up front - entries that resolve to the same zip
+    # only need one fetch, and len(by_file) is the real amount of work.
+    by_file = {}
+    for mod_name, info in updates.items():
+        by_file.setdefault(info["file_name"], []).append(mod_name)
+    if len(by_file) < len(updates):
+        log.info("%d update(s) share files - %d unique download(s)", len(updates), len(by_file))
 
-    # mod_name -> update info (only successfully downloaded)
+    # mod_name -> update info (only successfully downloaded or already present)
     successful = {}
 
-    try:
-        for mod_name, info in updates.items():
-            file_name = info["file_name"]
+    # A file already sitting in mods_dir with the right checksum (earlier
+    # partial run, manual install) doesn't need the network at all. One
+    # scandir snapshot replaces a stat call per candidate file.
+    with os.scandir(mods_dir) as it:
+        existing_files = {entry.name for entry in it if entry.is_file()}
+
+    pending = {}
+    for file_name, mod_names in by_file.items():
+        expected_sha1 = updates[mod_names[0]]["new_sha1"]
+        dest = os.path.join(mods_dir, file_name)
+        if expected_sha1 and file_name in existing_files and file_sha1(dest) == expected_sha1:
+            log.info("Already in mods_dir with matching SHA1 - skipping download: %s", file_name)
+            for mod_name in mod_names:
+                successful[mod_name] = updates[mod_name]
+        else:
+            pending[file_name] = mod_names
+
+    # Downloads are independent and I/O-bound - run them concurrently.
+    # download_mod streams each file straight into mods_dir through a
+    # .partial rename, so no separate staging folder or move pass needed.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as pool:
+        futures = {
+            pool.submit(download_mod, updates[mod_names[0]]["download_url"], file_name,
+                        mods_dir, username, token, updates[mod_names[0]]["new_sha1"]): mod_names
+            for file_name, mod_names in pending.items()
+        }
+        for future in as_completed(futures):
+            mod_names = futures[future]
             try:
-                tmp_path = download_mod(info["download_url"], file_name, tmp_dir, username, token)
-                successful[mod_name] = info
-            except (urllib.error.URLError, OSError, RuntimeError) as e:
-                log.error("Failed to download %s: %s", mod_name, e)
-
-        if not successful:
-            log.error("No mods were downloaded successfully")
-            return
-
-        # Move from temp to mods_dir
-        for mod_name, info in successful.items():
-            src = os.path.join(tmp_dir, info["file_name"])
-            dest = os.path.join(mods_dir, info["file_name"])
-            shutil.move(src, dest)
-            log.info("Moved: %s -> %s", info["file_name"], dest)
-
-    finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    # Archive and update mod-packs.json
-    archive_mod_packs(mod_packs_path)
+                future.result()
+                for mod_name in mod_names:
+                    successful[mod_name] = updates[mod_name]
+            except (http.client.HTTPException, OSError, RuntimeError) as e:
+                log.error("Failed to download %s: %s", ", ".join(mod_names), e)
+
+    if not successful:
+        log.error("No mods were downloaded successfully")
+        return
+
+    # Archive and update mod-packs.json - one timestamp for both, so the
+    # archive suffix and updated_at_ms always agree
+    now_ns = time.time_ns()
+    archive_mod_packs(mod_packs_path, now_ns // 1_000_000_000)
     log.info("Applying updates to all packs:")
-    updated_packs = apply_updates(packs, successful, factorio_version)
+    updated_packs = apply_updates(packs, successful, factorio_version, now_ns // 1_000_000)
     save_mod_packs(mod_packs_path, packs)
     log.info("Updated mod-packs.json (%d mod(s), %d pack(s))", len(successful), updated_packs)
 
@@ -359,10 +560,12 @@ def main():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Factorio mod updater")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging (DEBUG)")
+    parser.add_argument("--max-cache-age", type=int, metavar="MINUTES",
+                        help="Reuse the mod list cache if younger than this many minutes")
     args = parser.parse_args()
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
-    main()
+    main(args.max_cache_age)